@@ -28,7 +28,6 @@ from .colr import (
     get_all_names,
     get_known_codes,
     get_terminal_size,
-    in_range,
     InvalidArg,
     InvalidColr,
     parse_colr_arg,
@@ -522,7 +521,7 @@ def try_rgb(s, default=None):
         r, g, b = (int(x.strip()) for x in s.split(','))
     except ValueError:
         raise InvalidRgb(s)
-    if not all(in_range(x, 0, 255) for x in (r, g, b)):
+    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
         raise InvalidRgb(s)
 
     return r, g, b
@@ -36,9 +36,11 @@ from contextlib import suppress
 from functools import total_ordering
 from time import sleep
 from types import GeneratorType
-from typing import (
+from typing import (  # noqa
     Dict,
     List,
+    Optional,
+    Tuple,
     Union,
 )
 
@@ -46,7 +48,7 @@ __version__ = '0.9.3'
 
 _codepats = (
     # Colors.
-    r'(([\d;]+)?m{1})',
+    r'([\d;]*m)',
     # Cursor show/hide.
     r'(\?25l)',
     r'(\?25h)',
@@ -58,14 +60,28 @@ _codepats = (
     r'([\d]+[ABCDEFGHJKST])',
 )
 
-closing_code = '\033[0m'
+# Interned, to be the same object as codes['style']['reset_all'].
+closing_code = sys.intern('\033[0m')
 
+# Escape codes are plain ascii, so re.ASCII keeps \d from matching any
+# unicode digit, and saves some work on long strings.
 # Used to strip escape codes from a string.
 codepat = re.compile(
-    r'\033\[({})'.format('|'.join(_codepats))
+    r'\033\[({})'.format('|'.join(_codepats)),
+    re.ASCII,
 )
 # Used to grab codes from a string.
-codegrabpat = re.compile(r'\033\[[\d;]+?m{1}')
+codegrabpat = re.compile(r'\033\[[\d;]+m', re.ASCII)
+
+
+def _codes_len(s: str) -> int:
+    """ Return the total length of all escape codes in a string, without
+        building a stripped copy of it like `strip_codes()` does.
+    """
+    if '\033' not in s:
+        # No escape codes, skip the regex.
+        return 0
+    return sum(m.end() - m.start() for m in codepat.finditer(s))
 
 
 def get_codes(s: Union[str, 'ChainedBase']) -> List[str]:
@@ -143,7 +159,11 @@ def strip_codes(s: Union[str, 'ChainedBase']) -> str:
     """ Strip all color codes from a string.
         Returns empty string for "falsey" inputs (except 0).
     """
-    return codepat.sub('', str(s) if (s or (s == 0)) else '')
+    s = str(s) if (s or (s == 0)) else ''
+    if '\033' not in s:
+        # Nothing to strip, skip the regex.
+        return s
+    return codepat.sub('', s)
 
 
 @total_ordering
@@ -151,9 +171,16 @@ class ChainedBase(Sequence):
     """ Base object for Colr and Control. Handles basic string-manipulation
         methods.
     """
+    # Subclasses without their own __slots__ still get a __dict__.
+    # _stripped_cache is the last (data, stripped_data) pair from `stripped()`.
+    # __weakref__ keeps weakref.ref() working for all subclasses.
+    # Colr replaces `data` with a property, and keeps its `_parts` list in
+    # the `data` slot instead.
+    __slots__ = ('data', '_stripped_cache', '__weakref__')
 
     def __init__(self, text=None):
         self.data = str('' if text is None else text)
+        self._stripped_cache = None  # type: Optional[Tuple[str, str]]
 
     def __add__(self, other):
         """ Allow the old string concat methods through addition. """
@@ -372,17 +399,17 @@ class ChainedBase(Sequence):
     def __str__(self):
         return str(self.data)
 
-    def _str_just(
-            self, methodname, width, fillchar=' ', squeeze=False,
-            **colorkwargs):
+    def _str_just(self, strfunc, width, fillchar, squeeze, colorkwargs):
         """ Perform a str justify method on the text arg, or self.data, before
             applying color codes.
             Arguments:
-                methodname  : Name of str justification method to apply.
-                methodargs  : Arguments for the str method.
-
-            Keyword Arguments:
-                text, fore, back, style  : see color().
+                strfunc      : str justification method to apply,
+                               like `str.rjust`.
+                width        : Width for the str method.
+                fillchar     : Fill character for the str method.
+                squeeze      : Width applies to self.data and the text arg.
+                colorkwargs  : A dict with the text, fore, back, and style
+                               arguments. See color().
         """
         try:
             width = int(width)
@@ -394,27 +421,24 @@ class ChainedBase(Sequence):
             # text argument overrides self.data
             newtext = str(colorkwargs.pop('text'))
 
-        strfunc = getattr(str, methodname)
         if newtext:
             # Operating on text argument, self.data is left alone.
-            strippedtxt = strip_codes(newtext)
-            codelen = len(newtext) - len(strippedtxt)
-            width = width + codelen
+            width = width + _codes_len(newtext)
             if squeeze:
-                realoldlen = len(self.stripped())
-                width -= realoldlen
-            return self.__class__().join(
-                self,
-                self.__class__(
+                # stripped() reuses its result until self.data changes.
+                width -= len(self.stripped())
+            # Same as self.__class__().join(self, newobj), without the
+            # empty instance and the flattening.
+            return self.__class__(''.join((
+                str(self),
+                str(self.__class__(
                     strfunc(newtext, width, fillchar),
                     **colorkwargs
-                )
-            )
+                )),
+            )))
 
         # Operating on self.data.
-        strippedtxt = self.stripped()
-        codelen = len(self.data) - len(strippedtxt)
-        width = width + codelen
+        width = width + len(self.data) - len(self.stripped())
         return self.__class__(
             strfunc(self.data, width, fillchar),
             **colorkwargs
@@ -481,12 +505,7 @@ class ChainedBase(Sequence):
                 text     : The string to center, otherwise self.data is used.
                 fore, back, style : see color().
         """
-        return self._str_just(
-            'center',
-            width,
-            fillchar,
-            squeeze=squeeze,
-            **kwargs)
+        return self._str_just(str.center, width, fillchar, squeeze, kwargs)
 
     def chained(self, data):
         """ Called by the various ChainedBase methods to build a single string
@@ -562,13 +581,7 @@ class ChainedBase(Sequence):
                 text     : The string to left-justify, otherwise self.data.
                 fore, back, style : see color().
         """
-        return self._str_just(
-            'ljust',
-            width,
-            fillchar,
-            squeeze=squeeze,
-            **kwargs
-        )
+        return self._str_just(str.ljust, width, fillchar, squeeze, kwargs)
 
     def lstrip(self, chars=None):
         """ Like str.lstrip, except it returns the ChainedBase instance. """
@@ -598,13 +611,7 @@ class ChainedBase(Sequence):
                 text     : The string to right-justify, otherwise self.data.
                 fore, back, style : see color().
         """
-        return self._str_just(
-            'rjust',
-            width,
-            fillchar,
-            squeeze=squeeze,
-            **kwargs,
-        )
+        return self._str_just(str.rjust, width, fillchar, squeeze, kwargs)
 
     def rstrip(self, chars=None):
         """ Like str.rstrip, except it returns the ChainedBase instance. """
@@ -619,8 +626,20 @@ class ChainedBase(Sequence):
         return self.__class__(self._str_strip('strip', chars))
 
     def stripped(self):
-        """ Return str(strip_codes(self.data)) """
-        return strip_codes(self.data)
+        """ Return str(strip_codes(self.data))
+            The result is reused until self.data changes.
+        """
+        data = self.data
+        try:
+            cached = self._stripped_cache
+        except AttributeError:
+            # Subclass __init__ didn't set it.
+            cached = None
+        if (cached is not None) and (cached[0] is data):
+            return cached[1]
+        strippeddata = strip_codes(data)
+        self._stripped_cache = (data, strippeddata)
+        return strippeddata
 
     def write(self, file=sys.stdout, end='', delay=None):
         """ Write this control code str to a file, clear self.data, and
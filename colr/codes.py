@@ -5,6 +5,7 @@
     -Christopher Welborn 05-23-2019
 """
 
+import sys
 from typing import (
     Callable,
     Dict,
@@ -117,16 +118,20 @@ def _build_codes() -> Dict[str, Dict[str, str]]:
         'style': {},
     }  # type: Dict[str, Dict[str, str]]
 
+    # The codes are interned, so every copy of the same code (aliases,
+    # closing_code, reverse map keys) is one shared string object.
     for code_type, nameinfo in code_nums.items():
         if code_type in ('fore', 'back', 'style'):
-            built[code_type] = {k: codeformat(v) for k, v in nameinfo.items()}
+            built[code_type] = {
+                k: sys.intern(codeformat(v)) for k, v in nameinfo.items()
+            }
         elif code_type == 'fore_ext':
             built['fore'].update(
-                {k: extforeformat(v) for k, v in nameinfo.items()}
+                {k: sys.intern(extforeformat(k)) for k in nameinfo}
             )
         elif code_type == 'back_ext':
             built['back'].update(
-                {k: extbackformat(v) for k, v in nameinfo.items()}
+                {k: sys.intern(extbackformat(k)) for k in nameinfo}
             )
 
     return built
@@ -139,13 +144,11 @@ def _build_codes_reverse(
     """
     built = {}  # type: Dict[str, Dict[str, str]]
     for codetype, codemap in codes.items():
+        built[codetype] = reverse = {}
         for name, escapecode in codemap.items():
             # Skip shorcut aliases to avoid overwriting long names.
-            if len(name) < 2:
-                continue
-            if built.get(codetype, None) is None:
-                built[codetype] = {}
-            built[codetype][escapecode] = name
+            if len(name) >= 2:
+                reverse[escapecode] = name
     return built
 
 
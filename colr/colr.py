@@ -29,11 +29,11 @@
     DEALINGS IN THE SOFTWARE.
 """
 from contextlib import suppress  # type: ignore
-from functools import partial
+from functools import lru_cache, partial
+from itertools import cycle
 import ctypes
 import math
 import os
-import struct
 import sys
 
 from types import GeneratorType
@@ -78,7 +78,9 @@ from .trans import (
     ColorCode,
     hex2rgb,
     hex2term,
+    hex2term_map,
     hex2termhex,
+    rgb2termhex,
 )
 from .name_data import names as name_data
 
@@ -131,6 +133,41 @@ __all__ = [
     'rgbforeformat',
     'strip_codes',
 ]
+
+# Module-level references to the reverse code maps, to save a lookup
+# when reverse translating escape codes.
+_fore_rev = codes_reverse['fore']
+_back_rev = codes_reverse['back']
+_style_rev = codes_reverse['style']
+# Known fore/back/style names, for fast membership tests in
+# `Colr._attr_to_kwargs()`.
+_fore_keys = frozenset(codes['fore'])
+_back_keys = frozenset(codes['back'])
+_style_keys = frozenset(codes['style'])
+# All basic and known color names, for `parse_colr_arg()`.
+_all_valid_names = _fore_keys.union(name_data)
+# Extended code numbers for the 24-length black gradient, for each valid
+# start number (232-255), and direction: {(start, reverse): codes}
+_gradient_black_ranges = {
+    (start, reverse): tuple(
+        range(start, 231, -1) if reverse else range(start, 256)
+    )
+    for start in range(232, 256)
+    for reverse in (False, True)
+}  # type: Dict[Tuple[int, bool], Tuple[int, ...]]
+# Phase offsets for the green and blue parts of a rainbow (120/240 degrees).
+_rainbow_green_phase = 2 * math.pi / 3
+_rainbow_blue_phase = 4 * math.pi / 3
+# Nearest terminal color value for each rgb part value (0-255), as picked by
+# `rgb2termhex()`. Rainbows use it to find terminal codes without hex2term().
+_term_rgb_parts = tuple(
+    int(rgb2termhex(value, 0, 0)[:2], 16)
+    for value in range(256)
+)  # type: Tuple[int, ...]
+
+# Arg types for `Colr.color_code()` that are safe to use as cache keys.
+_color_code_cache_types = frozenset((str, int, tuple, type(None)))
+
 # Set with the enable/disable functions.
 _disabled = False
 
@@ -156,6 +193,53 @@ except AttributeError:
     pass
 
 
+@lru_cache(maxsize=64)
+def _accepted_types_colr(
+        accepted_values: Tuple[Tuple[str, ...], ...],
+        disabled: bool,
+        type_items: Tuple[Tuple[str, Any], ...] = (('fore', 'yellow'), ),
+        type_val_items: Tuple[Tuple[str, Any], ...] = (('fore', 'grey'), ),
+) -> str:
+    """ Build the colorized list of accepted types, for
+        `InvalidColr.as_colr()` and `InvalidFormatColr.as_colr()`.
+        `type_items` and `type_val_items` are the sorted items of the
+        Colr() keyword arguments, so they can be part of the cache key.
+        `disabled` is only used as part of the cache key, because
+        Colr() output depends on it.
+    """
+    type_args = dict(type_items)
+    type_val_args = dict(type_val_items)
+    return ',\n    '.join(
+        '{lbl:<5} ({val})'.format(
+            lbl=Colr(l, **type_args),
+            val=Colr(v, **type_val_args),
+        )
+        for l, v in accepted_values
+    )
+
+
+@lru_cache(maxsize=64)
+def _accepted_styles_colr(
+        disabled: bool,
+        type_items: Tuple[Tuple[str, Any], ...] = (('fore', 'yellow'), ),
+) -> str:
+    """ Build the colorized list of accepted styles, for
+        `InvalidStyle.as_colr()`.
+        `type_items` are the sorted items of the Colr() keyword arguments,
+        so they can be part of the cache key.
+        `disabled` is only used as part of the cache key, because
+        Colr() output depends on it.
+    """
+    type_args = dict(type_items)
+    return str(Colr(',\n    ').join(
+        Colr(', ').join(
+            Colr(v, **type_args)
+            for v in t[1]
+        )
+        for t in _stylemap
+    ))
+
+
 def auto_disable(
         enabled: Optional[bool] = True,
         fds: Optional[Sequence[IO]] = (sys.stdout, sys.stderr)) -> None:
@@ -229,70 +313,61 @@ def _format_code(
     """
     if backcolor:
         codetype = 'back'
-        # A dict of codeformat funcs. These funcs return an escape code str.
-        formatters = {
-            'code': lambda n: codeformat(40 + n),
-            'lightcode': lambda n: codeformat(100 + n),
-            'ext': lambda n: extbackformat(n),
-            'rgb': lambda r, g, b: rgbbackformat(r, g, b),
-        }  # type: Dict[str, Callable[..., str]]
+        basenum, lightnum = 40, 100
+        extformat, rgbformat = extbackformat, rgbbackformat
     else:
         codetype = 'fore'
-        formatters = {
-            'code': lambda n: codeformat(30 + n),
-            'lightcode': lambda n: codeformat(90 + n),
-            'ext': lambda n: extforeformat(n),
-            'rgb': lambda r, g, b: rgbforeformat(r, g, b),
-        }
-    try:
-        r, g, b = (int(x) for x in number)  # type: ignore
-    except (TypeError, ValueError):
-        # Not an rgb code.
-        # This variable, and it's cast is only to satisfy the type checks.
+        basenum, lightnum = 30, 90
+        extformat, rgbformat = extforeformat, rgbforeformat
+
+    if isinstance(number, int):
+        # Basic, light, or extended code number. The most common case.
+        # int() turns bools and int subclasses into plain ints.
+        n = int(number)
+    else:
         try:
-            n = int(cast(int, number))
-        except ValueError:
-            # Not an rgb code, or a valid code number.
-            raise InvalidColr(
-                number,
-                'Expecting RGB or 0-255 for {} code.'.format(codetype)
-            )
-        if light:
-            if not in_range(n, 0, 9):
+            r, g, b = (int(x) for x in number)  # type: ignore
+        except (TypeError, ValueError):
+            # Not an rgb code.
+            # This variable, and it's cast is only to satisfy the type checks.
+            try:
+                n = int(cast(int, number))
+            except ValueError:
+                # Not an rgb code, or a valid code number.
                 raise InvalidColr(
-                    n,
-                    'Expecting 0-9 for light {} code.'.format(codetype)
+                    number,
+                    'Expecting RGB or 0-255 for {} code.'.format(codetype)
                 )
-            return formatters['lightcode'](n)
-        elif extended:
-            if not in_range(n, 0, 255):
+        else:
+            # Rgb code.
+            if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
                 raise InvalidColr(
-                    n,
-                    'Expecting 0-255 for ext. {} code.'.format(codetype)
+                    (r, g, b),
+                    'RGB value for {} not in range 0-255.'.format(codetype)
                 )
-            return formatters['ext'](n)
+            return rgbformat(r, g, b)
 
-        if not in_range(n, 0, 9):
+    if light:
+        if not (0 <= n <= 9):
             raise InvalidColr(
                 n,
-                'Expecting 0-9 for {} code.'.format(codetype)
+                'Expecting 0-9 for light {} code.'.format(codetype)
             )
-        return formatters['code'](n)
-
-    # Rgb code.
-    try:
-        if not all(in_range(x, 0, 255) for x in (r, g, b)):
+        return codeformat(lightnum + n)
+    elif extended:
+        if not (0 <= n <= 255):
             raise InvalidColr(
-                (r, g, b),
-                'RGB value for {} not in range 0-255.'.format(codetype)
+                n,
+                'Expecting 0-255 for ext. {} code.'.format(codetype)
             )
-    except TypeError:
-        # Was probably a 3-char string. Not an rgb code though.
+        return extformat(n)
+
+    if not (0 <= n <= 9):
         raise InvalidColr(
-            (r, g, b),
-            'RGB value for {} contains invalid number.'.format(codetype)
+            n,
+            'Expecting 0-9 for {} code.'.format(codetype)
         )
-    return formatters['rgb'](r, g, b)
+    return codeformat(basenum + n)
 
 
 def format_back(
@@ -350,12 +425,13 @@ def get_code_num(s: str) -> Optional[int]:
     """ Get code number from an escape code.
         Raises InvalidEscapeCode if an invalid number is found.
     """
-    if ';' in s:
-        # Extended fore/back codes.
-        numberstr = s.rpartition(';')[-1][:-1]
-    else:
+    # Extended fore/back codes have the number after the last ';'.
+    start = s.rfind(';')
+    if start == -1:
         # Fore, back, style, codes.
-        numberstr = s.rpartition('[')[-1][:-1]
+        start = s.rfind('[')
+    # Skip the separator, and the trailing 'm'.
+    numberstr = s[start + 1:-1]
 
     num = try_parse_int(
         numberstr,
@@ -372,24 +448,98 @@ def get_code_num_rgb(s: str) -> Optional[Tuple[int, int, int]]:
     """ Get rgb code numbers from an RGB escape code.
         Raises InvalidRgbEscapeCode if an invalid number is found.
     """
-    parts = s.split(';')
-    if len(parts) != 5:
+    if s.count(';') != 4:
         raise InvalidRgbEscapeCode(s, reason='Count is off.')
-    rgbparts = parts[-3:]
-    if not rgbparts[2].endswith('m'):
+    if not s.endswith('m'):
         raise InvalidRgbEscapeCode(s, reason='Missing \'m\' on the end.')
 
-    rgbparts[2] = rgbparts[2].rstrip('m')
+    # The values start after the second ';' ('\033[38;2;' or '\033[48;2;'),
+    # and end before the 'm'.
+    rgbstart = s.index(';', s.index(';') + 1) + 1
+    rgbparts = s[rgbstart:-1].split(';')
     try:
-        r, g, b = [int(x) for x in rgbparts]
+        r, g, b = int(rgbparts[0]), int(rgbparts[1]), int(rgbparts[2])
     except ValueError as ex:
         raise InvalidRgbEscapeCode(s) from ex
 
-    if not all(in_range(x, 0, 255) for x in (r, g, b)):
+    if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
         raise InvalidRgbEscapeCode(s, reason='Not in range 0-255.')
     return r, g, b
 
 
+# Code formatter functions for each code type.
+_escape_code_formatters = {
+    'fore': format_fore,
+    'back': format_back,
+    'style': format_style,
+}
+# Escape codes for all basic names/numbers, and the known color names,
+# by (codetype, name). Basic codes win, like in `_get_escape_code()`.
+_escape_code_table = {
+    (codetype, name): code
+    for codetype, codemap in codes.items()
+    for name, code in codemap.items()
+}  # type: Dict[Tuple[str, str], str]
+_escape_code_table.update(
+    ((codetype, name), formatter(info['code'], extended=True))
+    for name, info in name_data.items()
+    for codetype, formatter in (('fore', format_fore), ('back', format_back))
+    if (codetype, name) not in _escape_code_table
+)
+
+
+@lru_cache(maxsize=1024)
+def _get_escape_code(codetype: str, value: ColorArg) -> str:
+    """ Convert user arg to escape code, for `Colr.get_escape_code()`.
+        Results are cached. Values that can't be cached safely
+        (anything but str/int) use `_get_escape_code.__wrapped__()`.
+    """
+    valuefmt = str(value).lower()
+    code = _escape_code_table.get((codetype, valuefmt), None)
+    if code is not None:
+        # Basic code from fore, back, or style, or a known color name.
+        return code
+
+    # Not a basic code, try known names.
+    converter = _escape_code_formatters.get(codetype, None)
+    if converter is None:
+        raise ValueError(
+            'Invalid code type. Expecting {}, got: {!r}'.format(
+                ', '.join(_escape_code_formatters),
+                codetype
+            )
+        )
+    # Try as hex.
+    with suppress(ValueError):
+        value = int(hex2term(value, allow_short=True))
+        return converter(value, extended=True)
+
+    named_data = name_data.get(valuefmt, None)
+    if named_data is not None:
+        # A known named color.
+        try:
+            return converter(named_data['code'], extended=True)
+        except TypeError:
+            # Passing a known name as a style?
+            if codetype == 'style':
+                raise InvalidStyle(value)
+            raise
+    # Not a known color name/value, try rgb.
+    try:
+        r, g, b = (int(x) for x in value)
+        # This does not mean we have a 3 int tuple. It could be '111'.
+        # The converter should catch it though.
+    except (TypeError, ValueError):
+        # Not an rgb value.
+        if codetype == 'style':
+            raise InvalidStyle(value)
+    try:
+        escapecode = converter(value)
+    except ValueError as ex:
+        raise InvalidColr(value) from ex
+    return escapecode
+
+
 def get_known_codes(
         s: Union[str, 'Colr'],
         unique: Optional[bool] = True,
@@ -398,7 +548,11 @@ def get_known_codes(
     """
 
     isdisabled = disabled()
-    orderedcodes = tuple((c, get_known_name(c)) for c in get_codes(s))
+    # Local names for everything used in the loop.
+    get_name = get_known_name
+    colorcode = ColorCode
+    reset_all = codes['style']['reset_all']
+    orderedcodes = tuple((c, get_name(c)) for c in get_codes(s))
     codesdone = set()  # type: Set[str]
 
     for code, codeinfo in orderedcodes:
@@ -416,14 +570,14 @@ def get_known_codes(
         typedesc = '{:>13}: {!r:<23}'.format(codetype.title(), code)
         if codetype.startswith(('extended', 'rgb')):
             if isdisabled:
-                codedesc = str(ColorCode(name, rgb_mode=rgb_mode))
+                codedesc = str(colorcode(name, rgb_mode=rgb_mode))
             else:
-                codedesc = ColorCode(name, rgb_mode=rgb_mode).example()
+                codedesc = colorcode(name, rgb_mode=rgb_mode).example()
         else:
             codedesc = ''.join((
                 code,
                 str(name).lstrip('(').rstrip(')'),
-                codes['style']['reset_all']
+                reset_all
             ))
 
         yield ' '.join((
@@ -432,6 +586,43 @@ def get_known_codes(
         ))
 
 
+def _get_known_ext_name(
+        s: str,
+        codetype: str,
+        reverse: Dict[str, str]) -> Tuple[str, ColorArg]:
+    """ Reverse translate an extended fore/back code to a known name,
+        falling back to the code number.
+    """
+    typedesc = 'extended {}'.format(codetype)
+    name = reverse.get(s, None)
+    if name is None:
+        return (typedesc, cast(int, get_code_num(s)))
+    return (typedesc, name)
+
+
+def _get_known_rgb_name(
+        s: str,
+        codetype: str,
+        reverse: Dict[str, str]) -> Optional[Tuple[str, ColorArg]]:
+    """ Reverse translate an RGB fore/back code to its (r, g, b) values. """
+    vals = get_code_num_rgb(s)
+    if vals is None:
+        return None
+    return ('rgb {}'.format(codetype), vals)
+
+
+# Escape code prefixes mapped to a handler, code type, and reverse code map,
+# so `get_known_name` can dispatch with a dict lookup.
+# Extended prefixes are 7 chars long, RGB prefixes are 6 chars long, so
+# malformed RGB codes like '\033[38;2m' still reach the RGB handler.
+_known_name_prefixes = {
+    '\033[38;5;': (_get_known_ext_name, 'fore', _fore_rev),
+    '\033[48;5;': (_get_known_ext_name, 'back', _back_rev),
+    '\033[38;2': (_get_known_rgb_name, 'fore', _fore_rev),
+    '\033[48;2': (_get_known_rgb_name, 'back', _back_rev),
+}  # type: Dict[str, Tuple[Callable[..., Any], str, Dict[str, str]]]
+
+
 def get_known_name(s: str) -> Optional[Tuple[str, ColorArg]]:
     """ Reverse translate a terminal code to a known color name, if possible.
         Returns a tuple of (codetype, knownname) on success.
@@ -441,51 +632,36 @@ def get_known_name(s: str) -> Optional[Tuple[str, ColorArg]]:
     if not s.endswith('m'):
         # All codes end with 'm', so...
         return None
-    if s.startswith('\033[38;5;'):
-        # Extended fore.
-        name = codes_reverse['fore'].get(s, None)
-        if name is None:
-            num = cast(int, get_code_num(s))
-            return ('extended fore', num)
-        else:
-            return ('extended fore', name)
-    elif s.startswith('\033[48;5;'):
-        # Extended back.
-        name = codes_reverse['back'].get(s, None)
-        if name is None:
-            num = cast(int, get_code_num(s))
-            return ('extended back', num)
-        else:
-            return ('extended back', name)
-    elif s.startswith('\033[38;2'):
-        # RGB fore.
-        vals = get_code_num_rgb(s)
-        if vals is not None:
-            return ('rgb fore', vals)
-    elif s.startswith('\033[48;2'):
-        # RGB back.
-        vals = get_code_num_rgb(s)
-        if vals is not None:
-            return ('rgb back', vals)
+    prefixinfo = (
+        _known_name_prefixes.get(s[:7], None) or
+        _known_name_prefixes.get(s[:6], None)
+    )
+    if prefixinfo is not None:
+        # Extended or RGB fore/back.
+        handler, codetype, reverse = prefixinfo
+        return handler(s, codetype, reverse)
     elif s.startswith('\033['):
         # Fore, back, style.
         number = cast(int, get_code_num(s))
         # Get code type based on number.
         if (number <= 7) or (number == 22):
             codetype = 'style'
+            reverse = _style_rev
         elif (((number >= 30) and (number < 40)) or
                 ((number >= 90) and (number < 100))):
             codetype = 'fore'
+            reverse = _fore_rev
         elif (((number >= 40) and (number < 50)) or
                 ((number >= 100) and (number < 110))):
             codetype = 'back'
+            reverse = _back_rev
         else:
             raise InvalidEscapeCode(
                 number,
                 'Expecting 0-7, 22, 30-39, or 40-49 for escape code',
             )
 
-        name = codes_reverse[codetype].get(s, None)
+        name = reverse.get(s, None)
         if name is not None:
             return (codetype, name)
 
@@ -495,45 +671,33 @@ def get_known_name(s: str) -> Optional[Tuple[str, ColorArg]]:
 
 def get_terminal_size(default=(80, 35)):
     """ Return terminal (width, height) """
-    # We may not need all of this code.
-    try:
-        termsize = os.get_terminal_size()
-    except AttributeError:
-        pass
-    else:
+    # Try stdout first, and then the other std fds in case it is redirected.
+    # os.get_terminal_size() does the TIOCGWINSZ ioctl in one C call.
+    for fd in (1, 0, 2):
+        try:
+            termsize = os.get_terminal_size(fd)
+        except (AttributeError, OSError, ValueError):
+            continue
         return tuple(termsize)
-    
-    # The old-fashioned way, for Linux anyway.
+
+    # Try the controlling terminal, for Linux anyway.
     try:
-        ctermid = os.ctermid()
-    except AttributeError:
+        fd = os.open(os.ctermid(), os.O_RDONLY)
+    except (AttributeError, EnvironmentError):
         # Not gonna work.
-        cr = None
+        pass
     else:
-        def ioctl_GWINSZ(fd):
-            try:
-                import fcntl
-                import termios
-                cr = struct.unpack(
-                    'hh',
-                    fcntl.ioctl(fd, termios.TIOCGWINSZ, '1234')
-                )
-                return cr
-            except (ImportError, EnvironmentError):
-                pass
-        cr = ioctl_GWINSZ(0) or ioctl_GWINSZ(1) or ioctl_GWINSZ(2)
-        if not cr:
-            try:
-                fd = os.open(ctermid, os.O_RDONLY)
-                cr = ioctl_GWINSZ(fd)
-                os.close(fd)
-            except EnvironmentError:
-                pass
-    if not cr:
         try:
-            cr = os.environ['LINES'], os.environ['COLUMNS']
-        except KeyError:
-            return default
+            return tuple(os.get_terminal_size(fd))
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    try:
+        cr = os.environ['LINES'], os.environ['COLUMNS']
+    except KeyError:
+        return default
     return int(cr[1]), int(cr[0])
 
 
@@ -567,42 +731,37 @@ def parse_colr_arg(
         # Try as int.
         intval = int(val)
     except ValueError:
-        # Try as rgb.
-        try:
-            r, g, b = (int(x.strip()) for x in val.split(','))
-        except ValueError:
-            if ',' in val:
-                # User tried rgb value and failed.
+        if ',' in val:
+            # Try as rgb.
+            rgbparts = val.split(',')
+            if len(rgbparts) != 3:
                 raise InvalidColr(val)
-
-            # Try as name (fore/back have the same names)
-            code = codes['fore'].get(val, None)
-            if code:
-                # Valid basic code from fore, bask, or style.
-                return val
-
-            # Not a basic code, try known names.
-            named_data = name_data.get(val, None)
-            if named_data is not None:
-                # A known named color.
-                return val
-
-            # Not a basic/extended/known name, try as hex.
             try:
-                if rgb_mode:
-                    return hex2rgb(val, allow_short=True)
-                return hex2termhex(val, allow_short=True)
+                # int() ignores surrounding whitespace, no strip() needed.
+                r, g, b = int(rgbparts[0]), int(rgbparts[1]), int(rgbparts[2])
             except ValueError:
+                # User tried rgb value and failed.
                 raise InvalidColr(val)
-        else:
             # Got rgb. Do some validation.
-            if not all((in_range(x, 0, 255) for x in (r, g, b))):
+            if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
                 raise InvalidColr(val)
             # Valid rgb.
             return r, g, b
+
+        # Try as a basic or known name (fore/back have the same names).
+        if val in _all_valid_names:
+            return val
+
+        # Not a basic/extended/known name, try as hex.
+        try:
+            if rgb_mode:
+                return hex2rgb(val, allow_short=True)
+            return hex2termhex(val, allow_short=True)
+        except ValueError:
+            raise InvalidColr(val)
     else:
         # Int value.
-        if not in_range(intval, 0, 255):
+        if not (0 <= intval <= 255):
             # May have been a hex value confused as an int.
             if len(val) in (3, 6):
                 try:
@@ -616,6 +775,40 @@ def parse_colr_arg(
         return intval
 
 
+def _rainbow_values(
+        count: int,
+        freq: float,
+        spread: float,
+        offset: float,
+        rgb_mode: bool) -> List[Any]:
+    """ Calculate the rainbow values for `count` characters at once.
+        Returns (r, g, b) tuples when `rgb_mode` is set, otherwise the nearest
+        terminal codes (what hex2term() would return for them).
+    """
+    sin = math.sin
+    greenphase = _rainbow_green_phase
+    bluephase = _rainbow_blue_phase
+    values = []
+    append = values.append
+    # Borrowed from lolcat, translated from ruby.
+    for i in range(count):
+        x = freq * (offset + i / spread)
+        append((
+            int(sin(x) * 127 + 128),
+            int(sin(x + greenphase) * 127 + 128),
+            int(sin(x + bluephase) * 127 + 128),
+        ))
+    if rgb_mode:
+        return values
+    # Terminal codes without building and parsing a hex string for every
+    # character.
+    parts = _term_rgb_parts
+    return [
+        hex2term_map['%02x%02x%02x' % (parts[r], parts[g], parts[b])]
+        for r, g, b in values
+    ]
+
+
 def try_parse_int(
         s: str,
         default: Optional[Any] = None,
@@ -652,6 +845,18 @@ class Colr(ChainedBase):
         'blue': 34,
         'cyan': 48,
     }
+    # `data` is a property that joins `_parts` when needed.
+    # The `_parts` list lives in ChainedBase's `data` slot, through the slot
+    # descriptor, so Colr doesn't carry an extra (unused) slot.
+    __slots__ = ()
+    _parts = ChainedBase.data  # type: Any
+    # Cached attribute names for `Colr.__dir__`, set on first use.
+    _dir_attrs = None  # type: Optional[Tuple[str, ...]]
+    # Cached `chained` kwargs for method names, like: {'red': {'fore': 'red'}}
+    _attr_kwargs = {}  # type: Dict[str, Dict[str, Any]]
+    # Cached codes for `color_code()` calls that use more than one arg.
+    _color_code_cache = {}  # type: Dict[Tuple[Any, Any, Any], str]
+    _color_code_cache_max = 1024
 
     def __init__(
             self,
@@ -661,6 +866,19 @@ class Colr(ChainedBase):
             style: Optional[str] = None,
             no_closing: Optional[bool] = False) -> None:
         """ Initialize a Colr object with text and color options. """
+        self._stripped_cache = None
+        if _disabled:
+            # No codes will be added, just use str.
+            self.data = '' if text is None else str(text)
+            return
+        if (fore is None) and (back is None) and (style is None):
+            # Plain/empty text (join(), _str_just(), etc.), nothing to add.
+            if text is None:
+                self.data = ''
+                return
+            if (text.__class__ is str) and ('\033' not in text):
+                self.data = text
+                return
         # Can be initialized with colored text, not required though.
         self.data = self.color(
             text,
@@ -672,49 +890,24 @@ class Colr(ChainedBase):
 
     def __call__(self, text=None, fore=None, back=None, style=None):
         """ Append text to this Colr object. """
-        self.data = ''.join((
-            self.data,
+        if _disabled:
+            # No codes will be added, just use str.
+            self._parts.append('' if text is None else str(text))
+            return self
+        self._parts.append(
             self.color(text=text, fore=fore, back=back, style=style)
-        ))
+        )
         return self
 
     def __dir__(self):
         """ Compute the fake method names, and include them in a listing
             of attributes for autocompletion/inspection.
+            The names never change, so they are only computed once.
         """
-
-        def fmtcode(s):
-            try:
-                int(s)
-                return 'f_{}'.format(s)
-            except ValueError:
-                return s
-
-        def fmtbgcode(s):
-            try:
-                int(s)
-                return 'b_{}'.format(s)
-            except ValueError:
-                return 'bg{}'.format(s)
-
-        attrs = [fmtcode(k) for k in codes['fore']]
-        attrs.extend(fmtbgcode(k) for k in codes['back'])
-        attrs.extend(k for k in codes['style'])
-        attrs.extend((
-            'center',
-            'chained',
-            'color_code',
-            'color',
-            'data',
-            'format',
-            'gradient',
-            'join',
-            'ljust',
-            'print',
-            'rjust',
-            'str'
-        ))
-        return attrs
+        cls = self.__class__
+        if cls._dir_attrs is None:
+            cls._dir_attrs = cls._compute_dir_attrs()
+        return list(cls._dir_attrs)
 
     def __format__(self, fmt):
         """ Allow format specs to apply to self.data, such as <, >, and ^.
@@ -767,44 +960,63 @@ class Colr(ChainedBase):
         if knownmethod is not None:
             return knownmethod
 
+        # __getattr__ is only called after normal lookup has failed,
+        # so trying self.__getattribute__ again would only fail again.
         try:
-            val = self.__getattribute__(attr)
-        except AttributeError as ex:
-            try:
-                val = self.data.__getattribute__(attr)
-            except AttributeError:
-                raise AttributeError(ex)
-        return val
+            return self.data.__getattribute__(attr)
+        except AttributeError:
+            raise AttributeError(
+                '\'{}\' object has no attribute \'{}\''.format(
+                    type(self).__name__,
+                    attr,
+                )
+            ) from None
 
-    def _attr_to_method(self, attr):
-        """ Return the correct color function by method name.
-            Uses `partial` to build kwargs on the `chained` func.
+    @staticmethod
+    def _attr_to_kwargs(attr):
+        """ Return the `chained` kwargs for a fore, back, or style
+            method name.
             On failure/unknown name, returns None.
         """
-
-        if attr in codes['fore']:
+        if attr in _fore_keys:
             # Fore method
-            return partial(self.chained, fore=attr)
-        elif attr in codes['style']:
+            return {'fore': attr}
+        elif attr in _style_keys:
             # Style method
-            return partial(self.chained, style=attr)
+            return {'style': attr}
         elif attr.startswith('bg'):
             # Back method
             name = attr[2:].lstrip('_')
-            if name in codes['back']:
-                return partial(self.chained, back=name)
+            if name in _back_keys:
+                return {'back': name}
         elif attr.startswith(('b256_', 'b_')):
             # Back 256 method
             # Remove the b256_ portion.
             name = attr.partition('_')[2]
-            return self._ext_attr_to_partial(name, 'back')
+            return Colr._ext_attr_to_kwargs(name, 'back')
         elif attr.startswith(('f256_', 'f_')):
             # Fore 256 method
             name = attr.partition('_')[2]
-            return self._ext_attr_to_partial(name, 'fore')
+            return Colr._ext_attr_to_kwargs(name, 'fore')
 
         return None
 
+    def _attr_to_method(self, attr):
+        """ Return the correct color function by method name.
+            Uses `partial` to build kwargs on the `chained` func.
+            The kwargs for known names are cached in `Colr._attr_kwargs`.
+            Only known names are cached, so stray attribute lookups don't
+            grow the cache.
+            On failure/unknown name, returns None.
+        """
+        kwargs = self._attr_kwargs.get(attr, None)
+        if kwargs is None:
+            kwargs = self._attr_to_kwargs(attr)
+            if kwargs is None:
+                return None
+            self._attr_kwargs[attr] = kwargs
+        return partial(self.chained, **kwargs)
+
     @classmethod
     def _call_dunder_colr(cls, obj):
         """ Call __colr__ on an object, after some checks.
@@ -830,8 +1042,42 @@ class Colr(ChainedBase):
             )
         return clr
 
-    def _ext_attr_to_partial(self, name, kwarg_key):
-        """ Convert a string like '233' or 'aliceblue' into partial for
+    @staticmethod
+    def _compute_dir_attrs():
+        """ Build a tuple of real and fake method names, for `__dir__`. """
+
+        def fmtcode(s):
+            if s.isdigit():
+                return 'f_{}'.format(s)
+            return s
+
+        def fmtbgcode(s):
+            if s.isdigit():
+                return 'b_{}'.format(s)
+            return 'bg{}'.format(s)
+
+        attrs = [fmtcode(k) for k in codes['fore']]
+        attrs.extend(fmtbgcode(k) for k in codes['back'])
+        attrs.extend(k for k in codes['style'])
+        attrs.extend((
+            'center',
+            'chained',
+            'color_code',
+            'color',
+            'data',
+            'format',
+            'gradient',
+            'join',
+            'ljust',
+            'print',
+            'rjust',
+            'str'
+        ))
+        return tuple(attrs)
+
+    @staticmethod
+    def _ext_attr_to_kwargs(name, kwarg_key):
+        """ Convert a string like '233' or 'aliceblue' into kwargs for
             self.chained.
         """
         try:
@@ -842,11 +1088,9 @@ class Colr(ChainedBase):
             if info is None:
                 # Not an int value or name_data name.
                 return None
-            kws = {kwarg_key: info['code']}
-            return partial(self.chained, **kws)
+            return {kwarg_key: info['code']}
         # Integer str passed, use the int value.
-        kws = {kwarg_key: intval}
-        return partial(self.chained, **kws)
+        return {kwarg_key: intval}
 
     def _gradient_black_line(
             self, text, start, step=1,
@@ -858,10 +1102,7 @@ class Colr(ChainedBase):
             start = 232
         elif start > 255:
             start = 255
-        if reverse:
-            codes = list(range(start, 231, -1))
-        else:
-            codes = list(range(start, 256))
+        codes = _gradient_black_ranges[(start, bool(reverse))]
         return ''.join((
             self._iter_text_wave(
                 text,
@@ -889,7 +1130,8 @@ class Colr(ChainedBase):
             # Increase the start for each line.
             def factor(i):
                 return start + (i * movefactor)
-        return '\n'.join((
+        # str.join() needs a list anyway, building one saves a conversion.
+        return '\n'.join([
             self._gradient_black_line(
                 line,
                 start=factor(i),
@@ -901,7 +1143,7 @@ class Colr(ChainedBase):
                 rgb_mode=rgb_mode,
             )
             for i, line in enumerate(text.splitlines())
-        ))
+        ])
 
     def _gradient_rgb_line(
             self, text, start, stop, step=1,
@@ -935,7 +1177,7 @@ class Colr(ChainedBase):
         usevals = morphlist
         if iterstep > 1:
             # Rebuild the morphlist, skipping some.
-            usevals = [usevals[i] for i in range(0, listlen, iterstep)]
+            usevals = morphlist[::iterstep]
         return ''.join((
             self._iter_text_wave(
                 text,
@@ -953,43 +1195,33 @@ class Colr(ChainedBase):
         """ Yield colorized characters, morphing from one rgb value to
             another. This treats each line separately.
         """
-        morphlist = list(self._morph_rgb(start, stop, step=step))
+        morphs = tuple(self._morph_rgb(start, stop, step=step))
         if movefactor:
             # Moving means we need the morph to wrap around.
-            morphlist.extend(self._morph_rgb(stop, start, step=step))
-            if movefactor < 0:
-                # Increase the start for each line.
-                def move():
-                    popped = []
-                    for _ in range(abs(movefactor)):
-                        try:
-                            popped.append(morphlist.pop(0))
-                        except IndexError:
-                            pass
-                    morphlist.extend(popped)
-                    return morphlist
-            else:
-                # Decrease start for each line.
-                def move():
-                    for _ in range(movefactor):
-                        try:
-                            val = morphlist.pop(-1)
-                        except IndexError:
-                            pass
-                        else:
-                            morphlist.insert(0, val)
-                    return morphlist
-
-        return '\n'.join((
+            morphs += tuple(self._morph_rgb(stop, start, step=step))
+        morphlen = len(morphs)
+
+        def line_morphs(i):
+            """ Return the morph values for line number `i`, moved by
+                `movefactor` more than the line before it.
+                A negative movefactor increases the start for each line,
+                a positive one decreases it.
+            """
+            if not movefactor:
+                return morphs
+            first = -(i + 1) * movefactor % morphlen
+            return morphs[first:] + morphs[:first]
+
+        return '\n'.join([
             self._gradient_rgb_line_from_morph(
                 line,
-                move() if movefactor else morphlist,
+                line_morphs(i),
                 fore=fore,
                 back=back,
                 style=style,
             )
             for i, line in enumerate(text.splitlines())
-        ))
+        ])
 
     def _iter_text_wave(
             self, text, numbers, step=1,
@@ -1013,7 +1245,6 @@ class Colr(ChainedBase):
 
         pos = 0
         end = len(text)
-        numbergen = self._iter_wave(numbers)
 
         def make_color(n):
             try:
@@ -1024,104 +1255,70 @@ class Colr(ChainedBase):
                 return n
             return r, g, b
 
-        try:
-            for value in numbergen:
-                lastchar = pos + step
-                yield self.color(
-                    text[pos:lastchar],
-                    fore=make_color(value) if fore is None else fore,
-                    back=make_color(value) if fore is not None else back,
-                    style=style
-                )
-                if lastchar >= end:
-                    numbergen.send(True)
-                pos = lastchar
-        except StopIteration:
-            return
+        # The wave goes up through the colors, and back down without
+        # repeating the ends: (1, 2, 3, 4) -> (1, 2, 3, 4, 3, 2)
+        # It is built once, and cycled until the text is done.
+        wave = [make_color(n) for n in numbers]
+        wave.extend(wave[-2:0:-1])
 
-    @staticmethod
-    def _iter_wave(iterable, count=0):
-        """ Move from beginning to end, and then end to beginning, a number of
-            iterations through an iterable (must accept len(iterable)).
-            Example:
-                print(' -> '.join(_iter_wave('ABCD', count=8)))
-                >> A -> B -> C -> D -> C -> B -> A -> B
-
-            If `count` is less than 1, this will run forever.
-            You can stop it by sending a Truthy value into the generator:
-                gen = self._iter_wave('test')
-                for c in gen:
-                    if c == 's':
-                        # Stop the generator early.
-                        gen.send(True)
-                    print(c)
-        """
-        up = True
-        pos = 0
-        i = 0
-        try:
-            end = len(iterable)
-        except TypeError:
-            iterable = list(iterable)
-            end = len(iterable)
-
-        # Stop on count, or run forever.
-        while (i < count) if count > 0 else True:
-            try:
-                stop = yield iterable[pos]
-                # End of generator (user sent the stop signal)
-                if stop:
-                    break
-            except IndexError:
-                # End of iterable, when len(iterable) is < count.
-                up = False
-
-            # Change directions if needed, otherwise increment/decrement.
-            if up:
-                pos += 1
-                if pos == end:
-                    up = False
-                    pos = end - 2
+        if fore is None:
+            def color_args(value):
+                return {'fore': value, 'back': back, 'style': style}
+        else:
+            def color_args(value):
+                return {'fore': fore, 'back': value, 'style': style}
+
+        # Only the wave value changes the codes, so they are built once for
+        # each value. Chunks without escape codes of their own always need
+        # the closing code, which is added here instead of by self.color().
+        codecache = {}  # type: Dict[Any, str]
+        colorcode = self.color_code
+        if (end and (step > 0)) and not (_disabled or ('\033' in text)):
+            # Common case, plain text. Build it all with a single join.
+            chunks = [text[i:i + step] for i in range(0, end, step)]
+            for colorval in set(wave[:len(chunks)]):
+                codecache[colorval] = colorcode(**color_args(colorval))
+            yield closing_code.join([
+                codecache[colorval] + chunk
+                for chunk, colorval in zip(chunks, cycle(wave))
+            ]) + closing_code
+            return
+        color = self.color
+        for colorval in cycle(wave):
+            lastchar = pos + step
+            chunk = text[pos:lastchar]
+            if _disabled or ('\033' in chunk):
+                yield color(chunk, **color_args(colorval))
             else:
-                pos -= 1
-                if pos < 0:
-                    up = True
-                    pos = 1
-            i += 1
+                code = codecache.get(colorval, None)
+                if code is None:
+                    code = codecache[colorval] = colorcode(
+                        **color_args(colorval)
+                    )
+                yield ''.join((code, chunk, closing_code)) if chunk else code
+            if lastchar >= end:
+                return
+            pos = lastchar
 
     def _morph_rgb(self, rgb1, rgb2, step=1):
         """ Morph an rgb value into another, yielding each step along the way.
+            Each value moves `step` closer to its target on every step,
+            and stays there once it is reached.
         """
-        pos1, pos2 = list(rgb1), list(rgb2)
-        indexes = [i for i, _ in enumerate(pos1)]
-
-        def step_value(a, b):
-            """ Returns the amount to add to `a` to make it closer to `b`,
-                multiplied by `step`.
-            """
-            if a < b:
-                return step
-            if a > b:
-                return -step
-            return 0
-
-        steps = [step_value(pos1[x], pos2[x]) for x in indexes]
-        stepcnt = 0
-        while (pos1 != pos2):
-            stepcnt += 1
-            stop = yield tuple(pos1)
-            if stop:
-                break
-            for x in indexes:
-                if pos1[x] != pos2[x]:
-                    pos1[x] += steps[x]
-                    if (steps[x] < 0) and (pos1[x] < pos2[x]):
-                        # Over stepped, negative.
-                        pos1[x] = pos2[x]
-                    if (steps[x] > 0) and (pos1[x] > pos2[x]):
-                        # Over stepped, positive.
-                        pos1[x] = pos2[x]
-        yield tuple(pos1)
+        pos1, pos2 = tuple(rgb1), tuple(rgb2)
+        # Number of steps needed for the furthest value to reach its target.
+        stepcnt = max(
+            (math.ceil(abs(b - a) / step) for a, b in zip(pos1, pos2)),
+            default=0,
+        )
+        steps = range(stepcnt + 1)
+        channels = [
+            [min(a + (i * step), b) for i in steps] if a < b else
+            [max(a - (i * step), b) for i in steps] if a > b else
+            [a] * len(steps)
+            for a, b in zip(pos1, pos2)
+        ]
+        return zip(*channels)
 
     def _parse_colr_spec(self, spec):
         """ Parse a Colr spec such as 'fore=red, back=blue, style=bold' into
@@ -1185,36 +1382,9 @@ class Colr(ChainedBase):
                 )
         return specargs
 
-    def _rainbow_color(self, freq, i):
-        """ Calculate a single hexcode value for a piece of a rainbow.
-            Arguments:
-                freq  : "Tightness" of colors (see self.rainbow())
-                i     : Index of character in string to colorize.
-        """
-        return '{:02x}{:02x}{:02x}'.format(*self._rainbow_rgb(freq, i))
-
-    def _rainbow_hex_chars(self, s, freq=0.1, spread=3.0, offset=0):
-        """ Iterate over characters in a string to build data needed for a
-            rainbow effect.
-            Yields tuples of (char, hexcode).
-            Arguments:
-                s      : String to colorize.
-                freq   : Frequency/"tightness" of colors in the rainbow.
-                         Best results when in the range 0.0-1.0.
-                         Default: 0.1
-                spread : Spread/width of colors.
-                         Default: 3.0
-                offset : Offset for start of rainbow.
-                         Default: 0
-        """
-        return (
-            (c, self._rainbow_color(freq, offset + i / spread))
-            for i, c in enumerate(s)
-        )
-
     def _rainbow_line(
             self, text, freq=0.1, spread=3.0, offset=0,
-            rgb_mode=False, **colorargs):
+            rgb_mode=False, codecache=None, **colorargs):
         """ Create rainbow using the same offset for all text.
             Arguments:
                 text       : String to colorize.
@@ -1227,6 +1397,10 @@ class Colr(ChainedBase):
                              Default: 0
                 rgb_mode   : If truthy, use RGB escape codes instead of
                              extended 256 and approximate hex match.
+                codecache  : A dict of {rainbow_value: escape_code}, to
+                             share codes between lines using the same
+                             color args.
+                             Default: None (a new dict for this line)
             Keyword Arguments:
                 colorargs  : Any extra arguments for the color function,
                              such as fore, back, style.
@@ -1238,29 +1412,42 @@ class Colr(ChainedBase):
         style = colorargs.get('style', None)
         if fore:
             color_args = (lambda value: {
-                'back': value if rgb_mode else hex2term(value),
+                'back': value,
                 'style': style,
                 'fore': fore
             })
         else:
             color_args = (lambda value: {
-                'fore': value if rgb_mode else hex2term(value),
+                'fore': value,
                 'style': style,
                 'back': back
             })
 
-        if rgb_mode:
-            method = self._rainbow_rgb_chars
-        else:
-            method = self._rainbow_hex_chars
-        return ''.join(
-            self.color(c, **color_args(hval))
-            for c, hval in method(
-                text,
-                freq=freq,
-                spread=spread,
-                offset=offset)
+        if _disabled:
+            return str(text)
+        if not text:
+            return ''
+        values = _rainbow_values(
+            len(text),
+            freq,
+            spread,
+            offset,
+            bool(rgb_mode),
         )
+        if codecache is None:
+            codecache = {}
+        # Rainbow values repeat, especially with a low freq or a high spread.
+        # Each escape code is only built once, and reused for the same value.
+        # Every character is a single non-empty char, so `self.color()` would
+        # always add the closing code. That is done here directly.
+        colorcode = self.color_code
+        for value in set(values).difference(codecache):
+            codecache[value] = colorcode(**color_args(value))
+        # Closing codes go between the pieces, and one more at the end.
+        return closing_code.join([
+            codecache[value] + c
+            for c, value in zip(text, values)
+        ]) + closing_code
 
     def _rainbow_lines(
             self, text, freq=0.1, spread=3.0, offset=0, movefactor=0,
@@ -1290,46 +1477,26 @@ class Colr(ChainedBase):
             # Increase the offset for each line.
             def factor(i):
                 return offset + (i * movefactor)
-        return '\n'.join(
+        # Lines with nearby offsets share a lot of rainbow values.
+        codecache = {}  # type: Dict[Union[str, Tuple[int, int, int]], str]
+        return '\n'.join([
             self._rainbow_line(
                 line,
                 freq=freq,
                 spread=spread,
                 offset=factor(i),
                 rgb_mode=rgb_mode,
+                codecache=codecache,
                 **colorargs)
-            for i, line in enumerate(text.splitlines()))
+            for i, line in enumerate(text.splitlines())
+        ])
 
-    def _rainbow_rgb(self, freq, i):
-        """ Calculate a single rgb value for a piece of a rainbow.
-            Arguments:
-                freq  : "Tightness" of colors (see self.rainbow())
-                i     : Index of character in string to colorize.
-        """
-        # Borrowed from lolcat, translated from ruby.
-        red = math.sin(freq * i + 0) * 127 + 128
-        green = math.sin(freq * i + 2 * math.pi / 3) * 127 + 128
-        blue = math.sin(freq * i + 4 * math.pi / 3) * 127 + 128
-        return int(red), int(green), int(blue)
-
-    def _rainbow_rgb_chars(self, s, freq=0.1, spread=3.0, offset=0):
-        """ Iterate over characters in a string to build data needed for a
-            rainbow effect.
-            Yields tuples of (char, (r, g, b)).
-            Arguments:
-                s      : String to colorize.
-                freq   : Frequency/"tightness" of colors in the rainbow.
-                         Best results when in the range 0.0-1.0.
-                         Default: 0.1
-                spread : Spread/width of colors.
-                         Default: 3.0
-                offset : Offset for start of rainbow.
-                         Default: 0
+    def append(self, char, length=1):
+        """ Append a char or str (`char`) a number of times (`length`).
+            Like `ChainedBase.append`, except it adds to the `_parts` buffer.
         """
-        return (
-            (c, self._rainbow_rgb(freq, offset + i / spread))
-            for i, c in enumerate(s)
-        )
+        self._parts.append(str(char) * length)
+        return self
 
     def b_hex(self, value, text=None, fore=None, style=None, rgb_mode=False):
         """ A chained method that sets the back color to an hex value.
@@ -1364,7 +1531,9 @@ class Colr(ChainedBase):
                 fore  : Fore color for the text.
                 style : Style for the text.
         """
-        return self.chained(text=text, fore=fore, back=(r, g, b), style=style)
+        # Same as chained(), without the extra call for this common method.
+        self._parts.append(self.color(text, fore, (r, g, b), style))
+        return self
 
     def chained(self, text=None, fore=None, back=None, style=None):
         """ Called by the various 'color' methods to colorize a single string.
@@ -1377,10 +1546,9 @@ class Colr(ChainedBase):
                 back  : Name of back color to use.
                 style : Name of style to use.
         """
-        self.data = ''.join((
-            self.data,
-            self.color(text=text, fore=fore, back=back, style=style),
-        ))
+        self._parts.append(
+            self.color(text=text, fore=fore, back=back, style=style)
+        )
         return self
 
     def color(
@@ -1403,6 +1571,9 @@ class Colr(ChainedBase):
         text = str(text) if text is not None else ''
         if _disabled:
             return text
+        if not (has_args or ('\033' in text)):
+            # No codes to add, and no embedded codes that need closing.
+            return text
 
         # Considered to have unclosed codes if embedded codes exist and
         # the last code was not a color code.
@@ -1420,24 +1591,42 @@ class Colr(ChainedBase):
             (not has_end_code) and
             (has_args or embedded_codes)
         )
+        codes = self.color_code(fore=fore, back=back, style=style)
+        # A fixed number of short strings, `+` is cheaper than a join here.
         if needs_closing:
-            end = closing_code
-        else:
-            end = ''
-        return ''.join((
-            self.color_code(fore=fore, back=back, style=style),
-            text,
-            end,
-        ))
+            return codes + text + closing_code
+        return codes + text
 
     def color_code(self, fore=None, back=None, style=None):
         """ Return the codes for this style/colors. """
-        # Map from style type to raw code formatter function.
+        # Most calls only use one of these, with no ordering to worry about.
+        if not (back or style):
+            return self.get_escape_code('fore', fore) if fore else ''
+        if not (fore or style):
+            return self.get_escape_code('back', back)
+        if not (fore or back):
+            return self.get_escape_code('style', style)
+        cachekey = (fore, back, style)
+        if type(self).get_escape_code is not Colr.get_escape_code:
+            # A subclass makes its own codes, the shared cache can't be used.
+            cachekey = None
+        elif {fore.__class__, back.__class__, style.__class__}.issubset(
+                _color_code_cache_types):
+            try:
+                return self._color_code_cache[cachekey]
+            except KeyError:
+                pass
+            except TypeError:
+                # Unhashable rgb values, like (1, 2, [3]).
+                cachekey = None
+        else:
+            # 1.0 and True hash like 1, but don't make the same codes.
+            cachekey = None
+        # Codes are built in style, back, fore order.
         colorcodes = []
         resetcodes = []
-        userstyles = {'style': style, 'back': back, 'fore': fore}
-        for stype in userstyles:
-            stylearg = userstyles.get(stype, None)
+        for stype, stylearg in (
+                ('style', style), ('back', back), ('fore', fore)):
             if not stylearg:
                 # No value for this style name, don't use it.
                 continue
@@ -1451,7 +1640,13 @@ class Colr(ChainedBase):
             else:
                 colorcodes.append(code)
         # Reset codes come first, to not override colors.
-        return ''.join((''.join(resetcodes), ''.join(colorcodes)))
+        codes = ''.join(resetcodes) + ''.join(colorcodes)
+        if cachekey is not None:
+            cache = self._color_code_cache
+            if len(cache) >= self._color_code_cache_max:
+                cache.clear()
+            cache[cachekey] = codes
+        return codes
 
     def color_dummy(self, text=None, **kwargs):
         """ A wrapper for str() that matches self.color().
@@ -1459,62 +1654,39 @@ class Colr(ChainedBase):
         """
         return str(text) if text is not None else ''
 
+    @property
+    def data(self):
+        """ The string data for this Colr.
+            Appended chunks are joined here, only when they are needed.
+        """
+        parts = self._parts
+        if len(parts) > 1:
+            self._parts = parts = [''.join(parts)]
+        return parts[0]
+
+    @data.setter
+    def data(self, value):
+        self._parts = [value]
+
     def format(self, *args, **kwargs):
         """ Like str.format, except it returns a Colr. """
         return self.__class__(self.data.format(*args, **kwargs))
 
     def get_escape_code(self, codetype, value):
         """ Convert user arg to escape code. """
-        valuefmt = str(value).lower()
-        code = codes[codetype].get(valuefmt, None)
-        if code:
-            # Basic code from fore, back, or style.
-            return code
-
-        named_funcs = {
-            'fore': format_fore,
-            'back': format_back,
-            'style': format_style,
-        }
-
-        # Not a basic code, try known names.
-        converter = named_funcs.get(codetype, None)
-        if converter is None:
-            raise ValueError(
-                'Invalid code type. Expecting {}, got: {!r}'.format(
-                    ', '.join(named_funcs),
-                    codetype
-                )
-            )
-        # Try as hex.
-        with suppress(ValueError):
-            value = int(hex2term(value, allow_short=True))
-            return converter(value, extended=True)
-
-        named_data = name_data.get(valuefmt, None)
-        if named_data is not None:
-            # A known named color.
+        if value.__class__ in (int, str):
+            return _get_escape_code(codetype, value)
+        if (value.__class__ is tuple) and (codetype != 'style'):
+            # Rgb values (rainbows/gradients) can't be names or hex values,
+            # so they go straight to the formatter.
             try:
-                return converter(named_data['code'], extended=True)
-            except TypeError:
-                # Passing a known name as a style?
-                if codetype == 'style':
-                    raise InvalidStyle(value)
-                raise
-        # Not a known color name/value, try rgb.
-        try:
-            r, g, b = (int(x) for x in value)
-            # This does not mean we have a 3 int tuple. It could be '111'.
-            # The converter should catch it though.
-        except (TypeError, ValueError):
-            # Not an rgb value.
-            if codetype == 'style':
-                raise InvalidStyle(value)
-        try:
-            escapecode = converter(value)
-        except ValueError as ex:
-            raise InvalidColr(value) from ex
-        return escapecode
+                return _escape_code_formatters[codetype](value)
+            except KeyError:
+                # Invalid code type, let the full version raise for it.
+                pass
+            except ValueError as ex:
+                raise InvalidColr(value) from ex
+        return _get_escape_code.__wrapped__(codetype, value)
 
     def gradient(
             self, text=None, name=None, fore=None, back=None, style=None,
@@ -1640,13 +1812,11 @@ class Colr(ChainedBase):
 
         if text:
             return self.__class__(
-                ''.join((
-                    self.data or '',
-                    method(
-                        text,
-                        start or (255 if reverse else 232),
-                        **gradargs)
-                ))
+                (self.data or '') + method(
+                    text,
+                    start or (255 if reverse else 232),
+                    **gradargs
+                )
             )
 
         # Operating on self.data.
@@ -1693,15 +1863,12 @@ class Colr(ChainedBase):
 
         if text:
             return self.__class__(
-                ''.join((
-                    self.data or '',
-                    method(
-                        text,
-                        start,
-                        stop,
-                        **gradargs
-                    ),
-                ))
+                (self.data or '') + method(
+                    text,
+                    start,
+                    stop,
+                    **gradargs
+                )
             )
 
         # Operating on self.data.
@@ -1762,22 +1929,24 @@ class Colr(ChainedBase):
                 fore, back, style...
                 see color().
         """
+        if colorkwargs:
+            fore = colorkwargs.get('fore', None)
+            back = colorkwargs.get('back', None)
+            style = colorkwargs.get('style', None)
+
+            def fmt(clr):
+                return self.color(str(clr), fore=fore, back=back, style=style)
+        else:
+            fmt = str
+
+        # Pieces are stringified and colorized in the same pass.
         flat = []
         for clr in colrs:
             if isinstance(clr, (list, tuple, GeneratorType)):
                 # Flatten any lists, at least once.
-                flat.extend(str(c) for c in clr)
+                flat.extend([fmt(c) for c in clr])
             else:
-                flat.append(str(clr))
-
-        if colorkwargs:
-            fore = colorkwargs.get('fore', None)
-            back = colorkwargs.get('back', None)
-            style = colorkwargs.get('style', None)
-            flat = (
-                self.color(s, fore=fore, back=back, style=style)
-                for s in flat
-            )
+                flat.append(fmt(clr))
         return self.__class__(self.data.join(flat))
 
     def lstrip(self, chars=None):
@@ -1827,6 +1996,15 @@ class Colr(ChainedBase):
         if fore and back:
             raise ValueError('Cannot use both fore and back with rainbow()')
 
+        if _disabled:
+            # No codes to build, but lines are still split/joined the same.
+            plaintext = str(text) if text else self.stripped()
+            if linemode:
+                plaintext = '\n'.join(plaintext.splitlines())
+            return self.__class__(
+                self.data + plaintext if text else plaintext
+            )
+
         rainbowargs = {
             'freq': freq,
             'spread': spread,
@@ -1845,10 +2023,7 @@ class Colr(ChainedBase):
         if text:
             # Prepend existing self.data to the rainbow text.
             return self.__class__(
-                ''.join((
-                    self.data,
-                    method(text, **rainbowargs)
-                ))
+                self.data + method(text, **rainbowargs)
             )
 
         # Operate on self.data.
@@ -1867,7 +2042,9 @@ class Colr(ChainedBase):
                 style : Style for the text.
 
         """
-        return self.chained(text=text, fore=(r, g, b), back=back, style=style)
+        # Same as chained(), without the extra call for this common method.
+        self._parts.append(self.color(text, (r, g, b), back, style))
+        return self
 
     def rstrip(self, chars=None):
         """ Like str.rstrip, except it returns the Colr instance. """
@@ -1945,6 +2122,9 @@ class InvalidArg(ValueError):
         return self.as_colr()
 
     def __str__(self):
+        if self.default_format is InvalidArg.default_format:
+            # Skip parsing the format string for the common case.
+            return ''.join((str(self.label), ': ', repr(self.value)))
         return self.default_format.format(
             label=self.label,
             value=repr(self.value)
@@ -1985,25 +2165,36 @@ class InvalidColr(InvalidArg):
         """ Like __str__, except it returns a colorized Colr instance. """
         return self.as_colr()
 
+    def _types_colr(self, type_args=None, type_val_args=None):
+        """ Return the colorized list of accepted types for as_colr().
+            Results are cached when the arguments are hashable.
+        """
+        type_args = type_args or {'fore': 'yellow'}
+        type_val_args = type_val_args or {'fore': 'grey'}
+        typeargs = (
+            self.accepted_values,
+            _disabled,
+            tuple(sorted(type_args.items())),
+            tuple(sorted(type_val_args.items())),
+        )
+        try:
+            return _accepted_types_colr(*typeargs)
+        except TypeError:
+            # Unhashable color args, like a list for rgb values, or a
+            # list of accepted values.
+            return _accepted_types_colr.__wrapped__(*typeargs)
+
     def as_colr(
             self, label_args=None, type_args=None, type_val_args=None,
             value_args=None):
         """ Like __str__, except it returns a colorized Colr instance. """
         label_args = label_args or {'fore': 'red'}
-        type_args = type_args or {'fore': 'yellow'}
-        type_val_args = type_val_args or {'fore': 'grey'}
         value_args = value_args or {'fore': 'blue', 'style': 'bright'}
 
         return Colr(self.default_format.format(
             label=Colr(':\n    ').join(
                 Colr('Expecting color name/value', **label_args),
-                ',\n    '.join(
-                    '{lbl:<5} ({val})'.format(
-                        lbl=Colr(l, **type_args),
-                        val=Colr(v, **type_val_args),
-                    )
-                    for l, v in self.accepted_values
-                )
+                self._types_colr(type_args, type_val_args),
             ),
             value=Colr(repr(self.value), **value_args)
         ))
@@ -2050,8 +2241,6 @@ class InvalidFormatColr(InvalidColr):
             value_args=None, spec_args=None):
         """ Like __str__, except it returns a colorized Colr instance. """
         label_args = label_args or {'fore': 'red'}
-        type_args = type_args or {'fore': 'yellow'}
-        type_val_args = type_val_args or {'fore': 'grey'}
         value_args = value_args or {'fore': 'blue', 'style': 'bright'}
         spec_args = spec_args or {'fore': 'blue'}
         spec_repr = repr(self.spec)
@@ -2064,13 +2253,7 @@ class InvalidFormatColr(InvalidColr):
                     '{} Expecting'.format(self.msg or self.default_msg),
                     **label_args
                 ),
-                ',\n    '.join(
-                    '{lbl:<5} ({val})'.format(
-                        lbl=Colr(l, **type_args),
-                        val=Colr(v, **type_val_args),
-                    )
-                    for l, v in self.accepted_values
-                )
+                self._types_colr(type_args, type_val_args),
             ),
             spec=Colr('=').join(
                 Colr(v, **spec_args)
@@ -2177,7 +2360,7 @@ class InvalidRgbEscapeCode(InvalidEscapeCode):
         self.reason = reason
 
     def __str__(self):
-        s = super().__str__(self)
+        s = super().__str__()
         if self.reason:
             s = '\n   '.join((s, str(self.reason)))
         return s
@@ -2195,19 +2378,19 @@ class InvalidStyle(InvalidColr):
             self, label_args=None, type_args=None, value_args=None):
         """ Like __str__, except it returns a colorized Colr instance. """
         label_args = label_args or {'fore': 'red'}
-        type_args = type_args or {'fore': 'yellow'}
         value_args = value_args or {'fore': 'blue', 'style': 'bright'}
+        type_args = type_args or {'fore': 'yellow'}
+        styleargs = (_disabled, tuple(sorted(type_args.items())))
+        try:
+            styles = _accepted_styles_colr(*styleargs)
+        except TypeError:
+            # Unhashable color args, like a list for rgb values.
+            styles = _accepted_styles_colr.__wrapped__(*styleargs)
 
         return Colr(self.default_format.format(
             label=Colr(':\n    ').join(
                 Colr('Expecting style value', **label_args),
-                Colr(',\n    ').join(
-                    Colr(', ').join(
-                        Colr(v, **type_args)
-                        for v in t[1]
-                    )
-                    for t in _stylemap
-                )
+                styles,
             ),
             value=Colr(repr(self.value), **value_args)
         ))
@@ -10,6 +10,7 @@
 import random
 import sys
 import unittest
+import weakref
 from contextlib import suppress
 
 from colr import (
@@ -19,9 +20,11 @@ from colr import (
     color,
     Colr,
     get_codes,
+    get_known_name,
     InvalidColr,
     InvalidFormatArg,
     InvalidFormatColr,
+    InvalidRgbEscapeCode,
     name_data,
     strip_codes,
 )
@@ -225,6 +228,25 @@ class ColrTests(ColrTestCase):
                     msg='str(Colr()) did not match.'
                 )
 
+    def test_add_unclosed(self):
+        """ Colr + str should close codes that were left open. """
+        unclosed = Colr()
+        unclosed.data = '\033[31mtest'
+        cases = (
+            unclosed,
+            Colr('test', 'red', no_closing=True),
+        )
+        for clr in cases:
+            self.assertEqual(
+                str(clr + 'ing'),
+                str(Colr(''.join((clr.data, 'ing')))),
+                msg='Adding to unclosed Colr data did not close it.',
+            )
+            self.assertTrue(
+                str(clr + 'ing').endswith(closing_code),
+                msg='Missing closing code: {!r}'.format(str(clr + 'ing')),
+            )
+
     def test_append(self):
         """ Colr.append should append a char, str, or Colr. """
         colrnames = ('red', 'blue', 'black', 'white')
@@ -247,6 +269,27 @@ class ColrTests(ColrTestCase):
         b = bytes(Colr(s))
         self.assertEqual(a, b, msg='Encoded Colr is not the same.')
 
+    def test_call(self):
+        """ Colr.__call__ should append text, and .data should join it. """
+        clr = Colr('test', 'red')
+        clr('ing', 'blue')(' done')
+        expected = ''.join((
+            str(Colr('test', 'red')),
+            str(Colr('ing', 'blue')),
+            ' done',
+        ))
+        self.assertEqual(
+            clr.data,
+            expected,
+            msg='Appended data was not joined properly.',
+        )
+        clr.data = 'reset'
+        self.assertEqual(
+            str(clr),
+            'reset',
+            msg='Setting .data did not replace appended data.',
+        )
+
     def test_chained_attr(self):
         """ Colr should allow chained color named methods. """
         # This will raise an AttributeError if the chained method is
@@ -320,6 +363,59 @@ class ColrTests(ColrTestCase):
                         )
                     )
 
+    def test_color_code_cache(self):
+        """ Cached Colr.color_code results should match uncached ones. """
+        argsets = (
+            {'fore': 'red', 'back': 'blue'},
+            {'fore': 16, 'back': 'white', 'style': 'bright'},
+            {'fore': (255, 0, 0), 'back': (0, 0, 255)},
+            {'fore': 'reset', 'back': 'red', 'style': 'underline'},
+        )
+        for args in argsets:
+            Colr._color_code_cache.clear()
+            uncached = Colr().color_code(**args)
+            self.assertEqual(
+                Colr().color_code(**args),
+                uncached,
+                msg='Cached color_code() did not match for: {!r}'.format(
+                    args
+                ),
+            )
+        # Values that hash like 1 don't share cached codes with 1.
+        for val in (1.0, True):
+            Colr._color_code_cache.clear()
+            expected = Colr().color_code(fore=val, back='red')
+            Colr._color_code_cache.clear()
+            Colr().color_code(fore=1, back='red')
+            self.assertEqual(
+                Colr().color_code(fore=val, back='red'),
+                expected,
+                msg='Cached code for 1 was used for {!r}.'.format(val),
+            )
+        # The cache doesn't grow past its limit.
+        for i in range(Colr._color_code_cache_max + 10):
+            Colr().color_code(fore=i % 256, back=(i % 256, i // 256, 0))
+        self.assertLessEqual(
+            len(Colr._color_code_cache),
+            Colr._color_code_cache_max,
+            msg='color_code() cache grew past its limit.',
+        )
+
+    def test_color_code_cache_subclass(self):
+        """ Subclasses overriding get_escape_code should not use the cache.
+        """
+        class ColrSub(Colr):
+            def get_escape_code(self, codetype, value):
+                return '<{}:{}>'.format(codetype, value)
+
+        args = {'fore': 'red', 'back': 'blue'}
+        Colr().color_code(**args)
+        self.assertEqual(
+            ColrSub().color_code(**args),
+            '<back:blue><fore:red>',
+            msg='Subclass get_escape_code() was skipped by the cache.',
+        )
+
     def test_color_colr(self):
         """ Colr.color should honor __colr__ methods. """
         customtext = 'test'
@@ -706,6 +802,25 @@ class ColrTests(ColrTestCase):
                 msg='Colr.__format__ differs from Colr() with same args.',
             )
 
+    def test_get_known_name(self):
+        """ get_known_name() should reverse translate escape codes. """
+        self.assertEqual(get_known_name('\033[31m'), ('fore', 'red'))
+        self.assertEqual(get_known_name('\033[41m'), ('back', 'red'))
+        self.assertEqual(get_known_name('\033[1m'), ('style', 'bold'))
+        self.assertEqual(
+            get_known_name('\033[38;5;196m'),
+            ('extended fore', '196'),
+        )
+        self.assertEqual(
+            get_known_name('\033[48;2;1;2;3m'),
+            ('rgb back', (1, 2, 3)),
+        )
+        self.assertIsNone(get_known_name('test'))
+        # Malformed RGB codes are reported as RGB errors.
+        for s in ('\033[38;2m', '\033[38;21m', '\033[48;2;1;2m'):
+            with self.assertRaises(InvalidRgbEscapeCode):
+                get_known_name(s)
+
     def test_getitem(self):
         """ Colr.__getitem__ should grab escape codes before and after. """
         # Simple string indexing, with color codes.
@@ -999,6 +1114,39 @@ class ColrTests(ColrTestCase):
                 msg='Failed to indent properly.',
             )
 
+    def test_invalid_colr_list_values(self):
+        """ InvalidColr.as_colr should work with list accepted_values. """
+        class InvalidColrList(InvalidColr):
+            accepted_values = [
+                ['name', 'white/black/etc.'],
+                ['value', '0-255'],
+            ]
+
+        for exc in (InvalidColr('x'), InvalidColrList('x')):
+            expected = ',\n    '.join(
+                '{lbl:<5} ({val})'.format(
+                    lbl=Colr(lbl, fore='yellow'),
+                    val=Colr(val, fore='grey'),
+                )
+                for lbl, val in exc.accepted_values
+            )
+            for kwargs in ({}, {'type_args': {'fore': [1, 2, 3]}}):
+                try:
+                    clr = exc.as_colr(**kwargs)
+                except TypeError as ex:
+                    self.fail(
+                        'as_colr() failed for {}: {}'.format(
+                            type(exc).__name__,
+                            ex,
+                        )
+                    )
+                if not kwargs:
+                    self.assertIn(
+                        expected,
+                        str(clr),
+                        msg='Accepted values were not listed.',
+                    )
+
     def test_iter(self):
         """ Colr should be iterable. """
         clr = Colr('This is a test.', 'red', 'blue', 'bright')
@@ -1231,6 +1379,20 @@ class ColrTests(ColrTestCase):
                 msg='Failed to strip characters from colorized Colr.',
             )
 
+    def test_slots(self):
+        """ Colr should not have a __dict__, and should keep its parts in
+            the `data` slot.
+        """
+        clr = Colr('test', 'red')
+        self.assertFalse(
+            hasattr(clr, '__dict__'),
+            msg='Colr instances should not have a __dict__.',
+        )
+        self.assertEqual(Colr.__slots__, ())
+        clr('ing', 'blue')
+        self.assertEqual(clr.data, ''.join(clr._parts))
+        self.assertEqual(clr, Colr('test', 'red') + Colr('ing', 'blue'))
+
     def test_strip(self):
         """ Colr.strip should strip characters and return another Colr. """
         teststrings = (
@@ -1328,6 +1490,27 @@ class ColrTests(ColrTestCase):
             func=c.stripped,
             msg='Stripped Colr has different content.',
         )
+        # Changes to .data should not return an old result.
+        c(' More.', fore='blue')
+        self.assertCallEqual(
+            'This is a test. More.',
+            c.stripped(),
+            func=c.stripped,
+            msg='Stripped Colr was not updated after appending.',
+        )
+        c.data = 'New data.'
+        self.assertCallEqual(
+            'New data.',
+            c.stripped(),
+            func=c.stripped,
+            msg='Stripped Colr was not updated after setting .data.',
+        )
+
+    def test_weakref(self):
+        """ Colr should support weak references, even with __slots__. """
+        clr = Colr('test', 'red')
+        ref = weakref.ref(clr)
+        self.assertIs(ref(), clr, msg='weakref.ref() did not return the Colr.')
 
 
 class CustomUserClass(object):